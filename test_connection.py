@@ -51,6 +51,33 @@ else:
     print("✗ PPCAutomation does not check for Google Cloud configuration")
     sys.exit(1)
 
+# Test 6: Verify wait_for_report returns the download URL once the report succeeds
+print("\nTest 6: Checking wait_for_report on a completed report...")
+try:
+    import importlib.machinery
+    import importlib.util
+    # Log to the console only, so loading main doesn't create a log file
+    os.environ.setdefault('FUNCTION_TARGET', 'test_connection')
+    loader = importlib.machinery.SourceFileLoader('ppc_main', 'main')
+    spec = importlib.util.spec_from_loader('ppc_main', loader)
+    ppc_main = importlib.util.module_from_spec(spec)
+    loader.exec_module(ppc_main)
+except ImportError as e:
+    print(f"- Skipped: dependencies for main not installed ({e})")
+else:
+    api = object.__new__(ppc_main.AmazonAdsAPI)
+    api.get_report_status = lambda report_id: {'status': 'SUCCESS', 'location': 'x'}
+    try:
+        location = api.wait_for_report('report-1', timeout=5)
+    except Exception as e:
+        print(f"✗ wait_for_report raised: {e!r}")
+        sys.exit(1)
+    if location == 'x':
+        print("✓ wait_for_report returns the report location")
+    else:
+        print(f"✗ wait_for_report returned {location!r}")
+        sys.exit(1)
+
 print("\n" + "="*60)
 print("All tests passed! ✓")
 print("="*60)